@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+"""Reproducible load test for the API.
+
+Runs the FastAPI ``app`` in-process (httpx ASGI transport, no network) against
+a throwaway database, seeds a synthetic dataset of each requested size and
+drives the hot routes at a fixed concurrency. Throughput, p50/p95/p99 latency
+and peak RSS are written to a JSON baseline that later runs can compare with.
+
+    python bench_api.py --sizes 10000,100000 --out bench_baseline.json
+    python bench_api.py --sizes 10000 --compare bench_baseline.json
+
+By default a local mongod is used (``--mongo-url``, database ``ems_bench``,
+dropped before each size). ``--mock`` swaps in ``mongomock_motor`` instead,
+which is convenient for smoke runs but not representative of real latency.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+ROOT_DIR = Path(__file__).parent
+
+BENCH_USER = 'bench'
+BENCH_PASSWORD = 'bench-password'
+SEED_BATCH = 5000
+
+
+async def seed(db, size: int):
+    import bcrypt
+    from indexes import INDEXES, index_models
+    from reset_db import employee_docs
+
+    await db.users.insert_one({
+        'id': str(uuid.uuid4()),
+        'username': BENCH_USER,
+        'role': 'Admin',
+        'password': bcrypt.hashpw(BENCH_PASSWORD.encode('utf-8'), bcrypt.gensalt()).decode('utf-8'),
+        'last_login': None,
+        'status': 'active',
+        'failed_attempts': 0,
+    })
+    batch = []
+    for doc in employee_docs(0, size, random.Random(42)):
+        batch.append(doc)
+        if len(batch) >= SEED_BATCH:
+            await db.employees.insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        await db.employees.insert_many(batch, ordered=False)
+    # Same indexes as a database prepared with reset_db.py
+    for collection in INDEXES:
+        await db[collection].create_indexes(index_models(collection))
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        # Windows: psutil exposes the peak working set, if it is installed
+        try:
+            import psutil
+        except ImportError:
+            return None
+        memory = psutil.Process().memory_info()
+        return getattr(memory, 'peak_wset', memory.rss) / (1024 * 1024)
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+async def run_scenario(http, method: str, url: str, total: int, concurrency: int, **kwargs):
+    latencies = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            t0 = time.perf_counter()
+            resp = await http.request(method, url, **kwargs)
+            await resp.aread()
+            latencies.append((time.perf_counter() - t0) * 1000)
+            if resp.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    rss = peak_rss_mb()
+    return {
+        'requests': total,
+        'errors': errors,
+        'throughput_rps': round(total / elapsed, 2) if elapsed else 0.0,
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'peak_rss_mb': round(rss, 1) if rss is not None else None,
+    }
+
+
+def scenarios(size: int, limit: int):
+    deep_page = max(1, size // limit // 2)
+    return [
+        ('login', 'POST', '/api/auth/login', {'json': {'username': BENCH_USER, 'password': BENCH_PASSWORD}}),
+        ('list_shallow', 'GET', '/api/employees/list', {'params': {'page': 1, 'limit': limit}}),
+        ('list_deep', 'GET', '/api/employees/list', {'params': {'page': deep_page, 'limit': limit}}),
+        ('list_search', 'GET', '/api/employees/list', {'params': {'page': 1, 'limit': limit, 'search': 'sharma'}}),
+        ('dashboard_stats', 'GET', '/api/dashboard/stats', {}),
+        ('export_csv', 'GET', '/api/export/csv', {}),
+        ('export_excel', 'GET', '/api/export/excel', {}),
+        ('export_pdf', 'GET', '/api/export/pdf', {}),
+    ]
+
+
+# Exports and logins are far heavier than list calls; scale their request counts down
+HEAVY_SCENARIOS = {'login': 0.25, 'export_csv': 0.1, 'export_excel': 0.1, 'export_pdf': 0.05}
+
+
+async def bench_size(core, app, size: int, args):
+    import httpx
+
+    await core.client.drop_database(core.db_name)
+    t0 = time.perf_counter()
+    await seed(core.db, size)
+    seed_s = time.perf_counter() - t0
+    print(f"[{size}] seeded in {seed_s:.1f}s")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench', timeout=None) as http:
+        resp = await http.post('/api/auth/login', json={'username': BENCH_USER, 'password': BENCH_PASSWORD})
+        resp.raise_for_status()
+        http.headers['Authorization'] = f"Bearer {resp.json()['token']}"
+
+        results = {'seed_seconds': round(seed_s, 2)}
+        for name, method, url, kwargs in scenarios(size, args.limit):
+            total = max(args.concurrency, int(args.requests * HEAVY_SCENARIOS.get(name, 1.0)))
+            results[name] = await run_scenario(http, method, url, total, args.concurrency, **kwargs)
+            r = results[name]
+            print(f"[{size}] {name:<16} {r['throughput_rps']:>9.1f} rps  p50={r['p50_ms']:.1f}ms "
+                  f"p95={r['p95_ms']:.1f}ms p99={r['p99_ms']:.1f}ms rss={r['peak_rss_mb'] or '?'}MB"
+                  f"{'  errors=' + str(r['errors']) if r['errors'] else ''}")
+    return results
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """Return human-readable regressions of ``current`` against ``baseline``."""
+    regressions = []
+    for size, scenarios_now in current['results'].items():
+        scenarios_then = baseline.get('results', {}).get(size, {})
+        for name, now in scenarios_now.items():
+            then = scenarios_then.get(name)
+            if not isinstance(now, dict) or not isinstance(then, dict):
+                continue
+            if then['p95_ms'] and now['p95_ms'] > then['p95_ms'] * (1 + tolerance):
+                regressions.append(f"{size}/{name}: p95 {then['p95_ms']}ms -> {now['p95_ms']}ms")
+            if then['throughput_rps'] and now['throughput_rps'] < then['throughput_rps'] * (1 - tolerance):
+                regressions.append(
+                    f"{size}/{name}: throughput {then['throughput_rps']} -> {now['throughput_rps']} rps"
+                )
+    return regressions
+
+
+async def main_async(args):
+    # Point the app at the benchmark database before it is imported
+    os.environ['MONGO_URL'] = args.mongo_url
+    os.environ['DB_NAME'] = args.db_name
+    # Every in-process request comes from one client address; without this the
+    # login throttle would answer most bench logins with 429
+    os.environ['LOGIN_MAX_ATTEMPTS_PER_CLIENT'] = str(10 ** 9)
+    os.environ['LOGIN_MAX_ATTEMPTS_PER_USER'] = str(10 ** 9)
+    sys.path.insert(0, str(ROOT_DIR))
+    if args.mock:
+        try:
+            import motor.motor_asyncio
+            from mongomock_motor import AsyncMongoMockClient
+        except ImportError:
+            sys.exit("--mock requires the mongomock-motor package")
+        # Must happen before core.py creates its client
+        motor.motor_asyncio.AsyncIOMotorClient = AsyncMongoMockClient
+    import core
+    import server
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'concurrency': args.concurrency,
+            'requests': args.requests,
+            'limit': args.limit,
+            'backend': 'mongomock' if args.mock else 'mongodb',
+        },
+        'results': {},
+    }
+    try:
+        for size in args.sizes:
+            report['results'][str(size)] = await bench_size(core, server.app, size, args)
+    finally:
+        await core.client.drop_database(args.db_name)
+        core.client.close()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10000,100000,1000000',
+                        type=lambda s: [int(x) for x in s.split(',') if x],
+                        help='comma separated employee counts to seed (default: %(default)s)')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=400, help='requests per list/dashboard scenario')
+    parser.add_argument('--limit', type=int, default=50, help='page size for list scenarios')
+    parser.add_argument('--mongo-url', default=os.environ.get('BENCH_MONGO_URL', 'mongodb://localhost:27017'))
+    parser.add_argument('--db-name', default='ems_bench')
+    parser.add_argument('--mock', action='store_true', help='use mongomock-motor instead of a real mongod')
+    parser.add_argument('--out', default=str(ROOT_DIR / 'bench_baseline.json'), help='where to write results')
+    parser.add_argument('--compare', help='baseline JSON to compare against; exits 1 on regression')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed relative regression (default 0.2)')
+    args = parser.parse_args()
+
+    # Load the baseline up front: --out may point at the same file
+    baseline = None
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+
+    report = asyncio.run(main_async(args))
+
+    with open(args.out, 'w') as fh:
+        json.dump(report, fh, indent=2)
+    print(f"Results written to {args.out}")
+
+    if baseline is not None:
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print("Regressions against baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("No regressions against baseline.")
+
+
+if __name__ == '__main__':
+    main()
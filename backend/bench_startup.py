@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""Cold-start benchmark: time to import the app and serve its first request.
+
+Each run happens in a fresh interpreter so nothing is cached in-process:
+
+    python bench_startup.py --runs 10 --out bench_startup.json
+
+No database round trip is needed; the first request is ``GET /api/health``
+through httpx's ASGI transport. The report also lists which heavy optional
+libraries were imported by ``import server`` (it should be none).
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).parent
+
+HEAVY_MODULES = ['reportlab', 'xlsxwriter']
+
+PROBE = f"""
+import asyncio, json, sys, time
+t0 = time.perf_counter()
+import server
+import_ms = (time.perf_counter() - t0) * 1000
+heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]
+
+import httpx
+
+async def first_request():
+    transport = httpx.ASGITransport(app=server.app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as http:
+        t1 = time.perf_counter()
+        resp = await http.get('/api/health')
+        return (time.perf_counter() - t1) * 1000, resp.status_code
+
+first_ms, status = asyncio.run(first_request())
+print(json.dumps({{'import_ms': import_ms, 'first_request_ms': first_ms, 'status': status, 'heavy': heavy}}))
+"""
+
+
+def run_once() -> dict:
+    out = subprocess.run(
+        [sys.executable, '-c', PROBE], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    )
+    # Logging goes to stderr; the last stdout line is the probe result
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def summarize(values):
+    return {
+        'min_ms': round(min(values), 2),
+        'median_ms': round(statistics.median(values), 2),
+        'max_ms': round(max(values), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--out', help='write the JSON report here as well as to stdout')
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+    report = {
+        'runs': args.runs,
+        'import': summarize([r['import_ms'] for r in runs]),
+        'first_request': summarize([r['first_request_ms'] for r in runs]),
+        'heavy_modules_at_import': sorted({m for r in runs for m in r['heavy']}),
+    }
+    print(json.dumps(report, indent=2))
+    if args.out:
+        with open(args.out, 'w') as fh:
+            json.dump(report, fh, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+"""Shared configuration, database handles and helpers used by every router."""
+from fastapi import HTTPException, Depends
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import DuplicateKeyError, PyMongoError
+import asyncio
+import os
+import logging
+from pathlib import Path
+from typing import Optional
+from datetime import datetime, timezone, timedelta
+import bcrypt
+import jwt
+import socket
+from db_monitor import CommandStatsListener
+from employee_cache import EmployeeCache
+from models import AuditLog
+from indexes import INDEXES, EMPLOYEE_SORT_FIELDS, index_models
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+# Configure logging early so middleware and startup can use `logger`
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Create uploads directory
+UPLOADS_DIR = ROOT_DIR / "uploads"
+UPLOADS_DIR.mkdir(exist_ok=True)
+
+# MongoDB connection (use defaults when env vars are missing)
+mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+db_name = os.environ.get('DB_NAME', 'ems')
+
+# Command monitoring: per-request DB stats and slow-query log
+SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', '100'))
+DEBUG = os.environ.get('DEBUG', 'false').lower() in ('1', 'true', 'yes')
+
+# Connection pool settings
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', '100'))
+MONGO_MIN_POOL_SIZE = int(os.environ.get('MONGO_MIN_POOL_SIZE', '5'))
+MONGO_MAX_IDLE_TIME_MS = int(os.environ.get('MONGO_MAX_IDLE_TIME_MS', '300000'))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', '5000'))
+client = AsyncIOMotorClient(
+    mongo_url,
+    maxPoolSize=MONGO_MAX_POOL_SIZE,
+    minPoolSize=MONGO_MIN_POOL_SIZE,
+    maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+    serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    event_listeners=[CommandStatsListener(slow_ms=SLOW_QUERY_MS)],
+)
+db = client[db_name]
+
+# Per-worker employee cache (0 disables it)
+employee_cache = EmployeeCache(db, max_size=int(os.environ.get('EMPLOYEE_CACHE_SIZE', '1024')))
+
+# JWT Secret
+JWT_SECRET = os.environ.get('JWT_SECRET', 'your-secret-key-change-in-production')
+JWT_ALGORITHM = 'HS256'
+JWT_EXPIRATION_HOURS = 24
+
+# Short-lived, stream-only tickets for EventSource URLs (see create_stream_ticket)
+STREAM_TICKET_SCOPE = 'stream'
+STREAM_TICKET_SECONDS = int(os.environ.get('STREAM_TICKET_SECONDS', '60'))
+
+# Identifies this worker process in shared locks
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+# Security
+security = HTTPBearer()
+
+# Helper Functions
+def hash_password(password: str) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+
+def verify_password(password: str, hashed: str) -> bool:
+    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+def create_token(user_id: str, username: str, role: str) -> str:
+    payload = {
+        'user_id': user_id,
+        'username': username,
+        'role': role,
+        'exp': datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRATION_HOURS)
+    }
+    return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    try:
+        token = credentials.credentials
+        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+    except jwt.ExpiredSignatureError:
+        raise HTTPException(status_code=401, detail="Token expired")
+    except jwt.InvalidTokenError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    # Stream tickets travel in URLs; they must not work as bearer tokens
+    if payload.get('scope'):
+        raise HTTPException(status_code=401, detail="Invalid token")
+    return payload
+
+def create_stream_ticket(user: dict) -> str:
+    # EventSource cannot send an Authorization header, so streams take a ticket
+    # in the query string instead of the (long-lived) login JWT, which would
+    # otherwise end up in access and proxy logs
+    payload = {
+        'user_id': user['user_id'],
+        'username': user['username'],
+        'role': user['role'],
+        'scope': STREAM_TICKET_SCOPE,
+        'exp': datetime.now(timezone.utc) + timedelta(seconds=STREAM_TICKET_SECONDS)
+    }
+    return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+
+async def get_current_user_from_ticket(ticket: str):
+    try:
+        payload = jwt.decode(ticket, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+    except jwt.ExpiredSignatureError:
+        raise HTTPException(status_code=401, detail="Ticket expired")
+    except jwt.InvalidTokenError:
+        raise HTTPException(status_code=401, detail="Invalid ticket")
+    if payload.get('scope') != STREAM_TICKET_SCOPE:
+        raise HTTPException(status_code=401, detail="Invalid ticket")
+    return payload
+
+def build_employee_query(search: Optional[str] = None, department: Optional[str] = None, status: Optional[str] = None) -> dict:
+    # Filters shared by the employee list/count routes and the exports
+    query = {}
+    
+    if search:
+        query['$or'] = [
+            {"name": {"$regex": search, "$options": "i"}},
+            {"email": {"$regex": search, "$options": "i"}},
+            {"emp_code": {"$regex": search, "$options": "i"}}
+        ]
+    
+    if department:
+        query['department'] = department
+    
+    if status:
+        query['status'] = status
+    
+    return query
+
+def build_employee_sort(sort_by: str, sort_order: str) -> list:
+    # Only indexed fields can be sorted on (see indexes.py); the id tiebreaker
+    # must match the sort index
+    if sort_by not in EMPLOYEE_SORT_FIELDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot sort by '{sort_by}'. Allowed: {', '.join(EMPLOYEE_SORT_FIELDS)}"
+        )
+    sort_dir = 1 if sort_order == "asc" else -1
+    return [(EMPLOYEE_SORT_FIELDS[sort_by], sort_dir), ("id", sort_dir)]
+
+async def generate_emp_code() -> str:
+    # Get the count of employees and generate code
+    count = await db.employees.count_documents({})
+    return f"EMP{str(count + 1).zfill(5)}"
+
+async def warm_up_pool():
+    # Concurrent pings force the driver to open MONGO_MIN_POOL_SIZE connections now
+    # instead of on the first requests
+    await asyncio.gather(*(client.admin.command('ping') for _ in range(max(1, MONGO_MIN_POOL_SIZE))))
+
+async def ensure_indexes():
+    # Only the non-unique sort/filter indexes: live data may hold duplicates.
+    # create_indexes is a no-op for indexes that already exist; a failed build
+    # is logged rather than taking the worker down
+    for collection in INDEXES:
+        for model in index_models(collection, include_unique=False):
+            try:
+                await db[collection].create_indexes([model])
+            except PyMongoError as e:
+                logger.error(f"Failed to build index {model.document['name']} on {collection}: {e}")
+
+async def acquire_lock(name: str, ttl: timedelta = timedelta(minutes=5)) -> bool:
+    # Lease-style lock shared by all workers; an expired lease can be taken over
+    now = datetime.now(timezone.utc)
+    lease = {"owner": WORKER_ID, "expires_at": now + ttl}
+    try:
+        await db.locks.insert_one({"_id": name, **lease})
+        return True
+    except DuplicateKeyError:
+        result = await db.locks.update_one(
+            {"_id": name, "expires_at": {"$lt": now}},
+            {"$set": lease}
+        )
+        return result.modified_count == 1
+
+async def release_lock(name: str):
+    await db.locks.delete_one({"_id": name, "owner": WORKER_ID})
+
+async def create_audit_log(action: str, user: str, employee_id: Optional[str] = None, employee_name: Optional[str] = None):
+    log = AuditLog(
+        action=action,
+        employee_id=employee_id,
+        employee_name=employee_name,
+        user=user
+    )
+    doc = log.model_dump()
+    doc['timestamp'] = doc['timestamp'].isoformat()
+    await db.audit_logs.insert_one(doc)
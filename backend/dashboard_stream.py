@@ -0,0 +1,87 @@
+"""Server-sent dashboard updates.
+
+One ``DashboardBroadcaster`` per worker recomputes the dashboard snapshot when
+employees change (debounced, and only while someone is listening) and fans the
+panels that actually changed out to every connected stream. The query cost is
+therefore per change, not per open dashboard tab.
+"""
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+Event = Tuple[str, Dict[str, Any]]
+
+
+class DashboardBroadcaster:
+    def __init__(self, compute_snapshot: Callable[[], Awaitable[Dict[str, Any]]],
+                 debounce: float = 1.0, keepalive: float = 15.0, queue_size: int = 16):
+        self.compute_snapshot = compute_snapshot
+        self.debounce = debounce
+        self.keepalive = keepalive
+        self.queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._last: Optional[Dict[str, Any]] = None
+        self._stale = True
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def notify(self, *_):
+        """Something changed; schedule one refresh for all subscribers."""
+        self._stale = True
+        if self._subscribers and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.get_running_loop().create_task(self._refresh())
+
+    async def _refresh(self):
+        while self._stale and self._subscribers:
+            # Coalesce bursts of writes into a single recompute
+            await asyncio.sleep(self.debounce)
+            try:
+                self._stale = False
+                snapshot = await self.compute_snapshot()
+            except Exception as e:
+                self._stale = True
+                logger.error(f"Failed to refresh dashboard snapshot: {e}", exc_info=True)
+                return
+            previous, self._last = self._last, snapshot
+            delta = {k: v for k, v in snapshot.items() if previous is None or previous.get(k) != v}
+            if delta:
+                for queue in list(self._subscribers):
+                    self._publish(queue, ('delta', delta))
+
+    def _publish(self, queue: asyncio.Queue, event: Event):
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow client: drop its backlog and resync it with the latest full snapshot
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(('snapshot', self._last))
+
+    async def _current(self) -> Dict[str, Any]:
+        if self._last is None or self._stale:
+            self._stale = False
+            self._last = await self.compute_snapshot()
+        return self._last
+
+    async def stream(self):
+        """Yield SSE frames: a full snapshot first, then deltas as they happen."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield self._format('snapshot', await self._current())
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(queue.get(), timeout=self.keepalive)
+                except asyncio.TimeoutError:
+                    # Comment frame keeps proxies from closing an idle connection
+                    yield ": keepalive\n\n"
+                    continue
+                yield self._format(event, data)
+        finally:
+            self._subscribers.discard(queue)
+
+    @staticmethod
+    def _format(event: str, data: Dict[str, Any]) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
@@ -0,0 +1,116 @@
+"""Per-request MongoDB command instrumentation.
+
+A PyMongo ``CommandListener`` records every command issued by the Motor
+client. While an HTTP request is in flight the middleware in ``server.py``
+binds a ``RequestDBStats`` to a context variable; Motor copies the current
+context into its executor threads, so the listener can attribute each
+command to the request that caused it.
+"""
+import contextvars
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from pymongo import monitoring
+
+logger = logging.getLogger("db.slow")
+
+# Collection-level commands whose filter is worth logging, mapped to a
+# function pulling the filter (or pipeline) out of the command document.
+_FILTER_GETTERS = {
+    'find': lambda cmd: cmd.get('filter'),
+    'count': lambda cmd: cmd.get('query'),
+    'distinct': lambda cmd: cmd.get('query'),
+    'aggregate': lambda cmd: cmd.get('pipeline'),
+    'findAndModify': lambda cmd: cmd.get('query'),
+    'update': lambda cmd: (cmd.get('updates') or [{}])[0].get('q'),
+    'delete': lambda cmd: (cmd.get('deletes') or [{}])[0].get('q'),
+}
+
+
+def filter_shape(value: Any) -> Any:
+    """Strip literal values from a query, keeping field names and operators."""
+    if isinstance(value, dict):
+        return {k: filter_shape(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [filter_shape(v) for v in value]
+    return '?'
+
+
+class RequestDBStats:
+    """Command count, total time and slowest command for one HTTP request."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def record(self, command_name: str, duration_ms: float):
+        with self._lock:
+            self.count += 1
+            self.total_ms += duration_ms
+            if duration_ms >= self.slowest_ms:
+                self.slowest_ms = duration_ms
+                self.slowest = command_name
+
+    def as_headers(self) -> Dict[str, str]:
+        headers = {
+            'X-DB-Commands': str(self.count),
+            'X-DB-Time-Ms': f"{self.total_ms:.2f}",
+            'Server-Timing': f'db;dur={self.total_ms:.2f};desc="{self.count} commands"',
+        }
+        if self.slowest:
+            headers['X-DB-Slowest'] = f"{self.slowest};dur={self.slowest_ms:.2f}"
+        return headers
+
+
+current_request_stats: contextvars.ContextVar[Optional[RequestDBStats]] = contextvars.ContextVar(
+    'current_request_stats', default=None
+)
+
+
+class CommandStatsListener(monitoring.CommandListener):
+    """Feeds per-request stats and logs commands slower than ``slow_ms``."""
+
+    def __init__(self, slow_ms: float = 100.0):
+        self.slow_ms = slow_ms
+        # (connection_id, request_id) -> (collection, filter shape) of commands in flight
+        self._pending: Dict[Tuple[Any, int], Tuple[Optional[str], Any]] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        getter = _FILTER_GETTERS.get(event.command_name)
+        shape = None
+        if getter is not None:
+            try:
+                shape = filter_shape(getter(event.command))
+            except Exception:
+                shape = None
+        collection = event.command.get(event.command_name)
+        if not isinstance(collection, str):
+            collection = None
+        with self._lock:
+            self._pending[(event.connection_id, event.request_id)] = (collection, shape)
+
+    def succeeded(self, event):
+        self._finish(event, failed=False)
+
+    def failed(self, event):
+        self._finish(event, failed=True)
+
+    def _finish(self, event, failed: bool):
+        with self._lock:
+            collection, shape = self._pending.pop((event.connection_id, event.request_id), (None, None))
+        duration_ms = event.duration_micros / 1000.0
+
+        stats = current_request_stats.get()
+        if stats is not None:
+            stats.record(event.command_name, duration_ms)
+
+        if duration_ms >= self.slow_ms:
+            logger.warning(
+                f"Slow query: {event.command_name} on {collection or event.database_name} "
+                f"took {duration_ms:.1f}ms{' (failed)' if failed else ''} filter={shape}"
+            )
@@ -0,0 +1,192 @@
+"""Per-worker read-through cache of employee documents.
+
+Each worker process keeps a bounded LRU of employee documents keyed by ``id``.
+Mutation routes evict locally via ``invalidate``; other workers learn about
+changes through a MongoDB change stream on ``employees``. Change streams need a
+replica set (Atlas always has one); on a standalone mongod the cache falls back
+to a small capped collection that mutation routes publish to and every worker
+tails.
+
+Callbacks registered with ``add_listener`` are told about every change seen
+through either path, so other per-worker state can follow the same channel. The
+watcher runs whenever there are listeners, even with the LRU disabled
+(``max_size=0``).
+"""
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import CursorType
+from pymongo.errors import CollectionInvalid, OperationFailure, PyMongoError
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_COLLECTION = 'cache_invalidations'
+INVALIDATION_COLLECTION_BYTES = 1024 * 1024
+# "$changeStream is only supported on replica sets" and friends
+_CHANGE_STREAM_UNSUPPORTED = {40573, 40324, 136}
+
+
+class EmployeeCache:
+    def __init__(self, db, max_size: int = 1024):
+        self.db = db
+        self.max_size = max_size
+        # employee id -> (Mongo _id, document)
+        self._entries: "OrderedDict[str, Tuple[Any, Dict[str, Any]]]" = OrderedDict()
+        # Mongo _id -> employee id, so change stream events can be mapped back
+        self._object_ids: Dict[Any, str] = {}
+        # Bumped on every invalidation; a read that raced with one is not cached
+        self._version = 0
+        self._watcher: Optional[asyncio.Task] = None
+        self._use_channel = False
+        self._worker_id = f"{os.getpid()}-{id(self)}"
+        self._listeners: List[Callable[[Optional[str]], None]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def peek(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached document without touching the database or LRU order."""
+        entry = self._entries.get(employee_id)
+        return entry[1] if entry is not None else None
+
+    async def get(self, employee_id: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the employee document, loading it on a miss."""
+        entry = self._entries.get(employee_id)
+        if entry is not None:
+            self._entries.move_to_end(employee_id)
+            return dict(entry[1])
+
+        version = self._version
+        doc = await self.db.employees.find_one({"id": employee_id})
+        if not doc:
+            return None
+        object_id = doc.pop('_id', None)
+        if isinstance(doc.get('created_at'), str):
+            doc['created_at'] = datetime.fromisoformat(doc['created_at'])
+        if isinstance(doc.get('updated_at'), str):
+            doc['updated_at'] = datetime.fromisoformat(doc['updated_at'])
+
+        if self.enabled and version == self._version:
+            self._entries[employee_id] = (object_id, doc)
+            self._object_ids[object_id] = employee_id
+            while len(self._entries) > self.max_size:
+                _, (evicted_object_id, _) = self._entries.popitem(last=False)
+                self._object_ids.pop(evicted_object_id, None)
+        return dict(doc)
+
+    def add_listener(self, callback: Callable[[Optional[str]], None]):
+        """Call ``callback(employee_id)`` on every change (``None`` when unknown)."""
+        self._listeners.append(callback)
+
+    def _notify(self, employee_id: Optional[str]):
+        for callback in self._listeners:
+            try:
+                callback(employee_id)
+            except Exception as e:
+                logger.error(f"Employee change listener failed: {e}", exc_info=True)
+
+    def evict(self, employee_id: str):
+        self._version += 1
+        entry = self._entries.pop(employee_id, None)
+        if entry is not None:
+            self._object_ids.pop(entry[0], None)
+        self._notify(employee_id)
+
+    def clear(self):
+        self._version += 1
+        self._entries.clear()
+        self._object_ids.clear()
+        self._notify(None)
+
+    async def invalidate(self, employee_id: str):
+        """Evict ``employee_id`` here and, in channel mode, in every other worker."""
+        self.evict(employee_id)
+        if self._use_channel:
+            try:
+                await self.db[INVALIDATION_COLLECTION].insert_one({
+                    'employee_id': employee_id,
+                    'origin': self._worker_id,
+                })
+            except PyMongoError as e:
+                logger.error(f"Failed to publish cache invalidation for {employee_id}: {e}")
+
+    def start(self):
+        # Listeners need the change feed even when nothing is cached here
+        if (self.enabled or self._listeners) and self._watcher is None:
+            self._watcher = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        if self._watcher is not None:
+            self._watcher.cancel()
+            try:
+                await self._watcher
+            except asyncio.CancelledError:
+                pass
+            self._watcher = None
+
+    async def _watch(self):
+        backoff = 1
+        while True:
+            try:
+                if self._use_channel:
+                    await self._tail_channel()
+                else:
+                    await self._watch_change_stream()
+                backoff = 1
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                if not self._use_channel and e.code in _CHANGE_STREAM_UNSUPPORTED:
+                    logger.info("Change streams unavailable; using capped-collection cache invalidation")
+                    await self._ensure_channel()
+                    self._use_channel = True
+                    continue
+                logger.warning(f"Employee cache watcher error: {e}")
+            except PyMongoError as e:
+                logger.warning(f"Employee cache watcher error: {e}")
+            # Anything may have changed while we were not listening
+            self.clear()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+
+    async def _watch_change_stream(self):
+        pipeline = [{"$match": {"operationType": {"$in": ["insert", "update", "replace", "delete"]}}}]
+        async with self.db.employees.watch(pipeline) as stream:
+            async for change in stream:
+                # Bump the version even for uncached ids so in-flight reads aren't stored
+                self._version += 1
+                employee_id = self._object_ids.get(change['documentKey']['_id'])
+                if employee_id is not None:
+                    self.evict(employee_id)
+                else:
+                    self._notify(None)
+        # The stream closed (collection dropped/renamed)
+        self.clear()
+
+    async def _ensure_channel(self):
+        try:
+            await self.db.create_collection(
+                INVALIDATION_COLLECTION, capped=True, size=INVALIDATION_COLLECTION_BYTES
+            )
+        except CollectionInvalid:
+            pass
+
+    async def _tail_channel(self):
+        # Only events published after we start listening matter
+        last_id = ObjectId.from_datetime(datetime.now(timezone.utc))
+        while True:
+            cursor = self.db[INVALIDATION_COLLECTION].find(
+                {'_id': {'$gt': last_id}}, cursor_type=CursorType.TAILABLE_AWAIT
+            )
+            while cursor.alive:
+                async for event in cursor:
+                    last_id = event['_id']
+                    if event.get('origin') != self._worker_id:
+                        self.evict(event['employee_id'])
+            await asyncio.sleep(0.5)
@@ -0,0 +1,63 @@
+"""MongoDB index definitions shared by the app, reset_db.py and the benchmarks.
+
+Every sortable employee field gets a compound ``(field, id)`` index with the
+case-insensitive ``SORT_COLLATION``. List queries run with the same collation
+and always sort by ``id`` as a tiebreaker, so each allowed sort is an index
+walk rather than an in-memory sort, and names order case-insensitively.
+
+Unique indexes are only built by reset_db.py on a fresh database; app start-up
+(``index_models(..., include_unique=False)``) never adds them, since existing
+data may already contain duplicates. Collated indexes have their own names so
+they can coexist with plain indexes on the same keys.
+"""
+from pymongo.collation import Collation
+
+SORT_COLLATION = Collation(locale='en', strength=2)
+
+# Query value of sort_by -> document field
+EMPLOYEE_SORT_FIELDS = {
+    'name': 'name',
+    'emp_code': 'emp_code',
+    'department': 'department',
+    'salary': 'salary',
+    'join_date': 'join_date',
+    'created_at': 'created_at',
+}
+
+# collection -> [(keys, options)]
+INDEXES = {
+    'employees': [
+        ([('id', 1)], {'unique': True}),
+        # Covers id-keyed lookups that only need these fields (?fields=id,name)
+        ([('id', 1), ('name', 1), ('emp_code', 1), ('department', 1)], {'name': 'lookup_id'}),
+        ([('email', 1)], {'unique': True}),
+        ([('emp_code', 1)], {'unique': True}),
+        # Plain filter indexes for queries without a collation (dashboard counts,
+        # distinct department)
+        ([('department', 1), ('status', 1)], {}),
+        ([('status', 1)], {}),
+        # Filter indexes share the collation so collated list/count queries can use them
+        ([('department', 1), ('status', 1)], {'name': 'filter_department_status', 'collation': SORT_COLLATION}),
+        ([('status', 1)], {'name': 'filter_status', 'collation': SORT_COLLATION}),
+    ] + [
+        ([(field, 1), ('id', 1)], {'name': f"sort_{field}", 'collation': SORT_COLLATION})
+        for field in EMPLOYEE_SORT_FIELDS.values()
+    ],
+    'users': [
+        ([('username', 1)], {'unique': True}),
+        ([('id', 1)], {'unique': True}),
+    ],
+    'audit_logs': [
+        ([('timestamp', -1)], {}),
+        ([('employee_id', 1), ('timestamp', -1)], {}),
+    ],
+}
+
+
+def index_models(collection: str, include_unique: bool = True):
+    from pymongo import IndexModel
+
+    return [
+        IndexModel(keys, **options) for keys, options in INDEXES[collection]
+        if include_unique or not options.get('unique')
+    ]
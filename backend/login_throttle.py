@@ -0,0 +1,59 @@
+"""In-memory sliding-window throttle for login attempts.
+
+Checked before any database or bcrypt work so a burst of guesses against one
+username, or from one client, is rejected cheaply. State is per worker; with N
+workers the effective limit is at most N times the configured one, which is
+fine for keeping floods off the CPU.
+
+Keys are kept in order of their latest recorded attempt, so expired keys are
+dropped from the front in amortized O(1) per call. Past ``max_keys`` the least
+recently active keys are evicted, which bounds memory when a flood uses many
+distinct usernames.
+"""
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Optional
+
+
+class SlidingWindowThrottle:
+    def __init__(self, limit: int, window: float, max_keys: int = 100000,
+                 clock: Callable[[], float] = time.monotonic):
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self.clock = clock
+        # key -> attempt timestamps, ordered by each key's latest attempt
+        self._hits: "OrderedDict[str, Deque[float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._hits)
+
+    def hit(self, key: str) -> Optional[float]:
+        """Record an attempt; return seconds to wait if ``key`` is over the limit."""
+        now = self.clock()
+        self._expire(now)
+
+        hits = self._hits.get(key)
+        if hits is None:
+            hits = self._hits[key] = deque()
+        while hits and hits[0] <= now - self.window:
+            hits.popleft()
+        if len(hits) >= self.limit:
+            return max(0.0, hits[0] + self.window - now)
+        hits.append(now)
+        self._hits.move_to_end(key)
+        while len(self._hits) > self.max_keys:
+            self._hits.popitem(last=False)
+        return None
+
+    def reset(self, key: str):
+        self._hits.pop(key, None)
+
+    def _expire(self, now: float):
+        # The front key has the oldest latest attempt; stop at the first live one
+        cutoff = now - self.window
+        while self._hits:
+            key, hits = next(iter(self._hits.items()))
+            if hits and hits[-1] > cutoff:
+                break
+            del self._hits[key]
@@ -0,0 +1,135 @@
+from pydantic import BaseModel, Field, ConfigDict, EmailStr
+from typing import Dict, List, Optional
+import uuid
+from datetime import datetime, timezone
+
+# Models
+class User(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    username: str
+    role: str  # Admin, HR, Manager
+    last_login: Optional[datetime] = None
+    status: str = "active"  # active, locked
+    failed_attempts: int = 0
+
+class UserCreate(BaseModel):
+    username: str
+    password: str
+    role: str
+
+class LoginRequest(BaseModel):
+    username: str
+    password: str
+
+class LoginResponse(BaseModel):
+    token: str
+    user: User
+
+class Employee(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    emp_code: str
+    name: str
+    email: EmailStr
+    department: str
+    role: str
+    salary: float
+    join_date: str
+    phone: str
+    address: str
+    photo: Optional[str] = None
+    status: str = "active"  # active, inactive
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class EmployeeCreate(BaseModel):
+    name: str
+    email: EmailStr
+    department: str
+    role: str
+    salary: float
+    join_date: str
+    phone: str
+    address: str
+    photo: Optional[str] = None
+
+class EmployeeUpdate(BaseModel):
+    name: Optional[str] = None
+    email: Optional[EmailStr] = None
+    department: Optional[str] = None
+    role: Optional[str] = None
+    salary: Optional[float] = None
+    join_date: Optional[str] = None
+    phone: Optional[str] = None
+    address: Optional[str] = None
+    photo: Optional[str] = None
+    status: Optional[str] = None
+
+class EmployeeBatchRequest(BaseModel):
+    ids: List[str]
+    fields: Optional[str] = None
+
+class EmployeeBatchResponse(BaseModel):
+    employees: Dict[str, Employee]
+    missing: List[str]
+
+class AuditLog(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    action: str
+    employee_id: Optional[str] = None
+    employee_name: Optional[str] = None
+    user: str
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class DashboardStats(BaseModel):
+    total_employees: int
+    active_employees: int
+    department_count: int
+    average_salary: float
+
+class DepartmentData(BaseModel):
+    department: str
+    count: int
+
+class SalaryData(BaseModel):
+    department: str
+    average_salary: float
+
+class StreamTicket(BaseModel):
+    ticket: str
+    expires_in: int
+
+class DashboardSnapshot(BaseModel):
+    stats: DashboardStats
+    department_data: List[DepartmentData]
+    salary_data: List[SalaryData]
+    recent_activities: List[AuditLog]
+
+class SalaryDistribution(BaseModel):
+    group: str
+    count: int
+    mean: float
+    min: float
+    p10: float
+    p25: float
+    median: float
+    p75: float
+    p90: float
+    max: float
+    lower_fence: float
+    upper_fence: float
+    outliers_low: int
+    outliers_high: int
+    histogram: List[int]
+
+class SalaryAnalytics(BaseModel):
+    group_by: str
+    bin_edges: List[float]
+    overall: Optional[SalaryDistribution] = None
+    groups: List[SalaryDistribution]
+
+class GrowthData(BaseModel):
+    month: str
+    count: int
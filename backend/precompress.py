@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""Write .gz and .br variants of the frontend build's static assets.
+
+Run after ``npm run build`` when the API serves the frontend itself
+(SERVE_FRONTEND=true):
+
+    python precompress.py ../frontend/build
+
+Only compressible files under ``static/`` larger than --min-size are
+processed, and a variant is kept only if it is actually smaller. Brotli output
+needs the optional ``brotli`` package; without it only gzip variants are
+written.
+"""
+import argparse
+import gzip
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+ROOT_DIR = Path(__file__).parent
+COMPRESSIBLE_SUFFIXES = {'.js', '.css', '.map', '.json', '.svg', '.txt', '.html', '.ico', '.woff', '.ttf'}
+
+
+def precompress(build_dir: Path, min_size: int = 1024):
+    written = skipped = 0
+    for path in sorted((build_dir / 'static').rglob('*')):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE_SUFFIXES:
+            continue
+        data = path.read_bytes()
+        if len(data) < min_size:
+            continue
+        variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            variants.append(('.br', brotli.compress(data, quality=11)))
+        for suffix, compressed in variants:
+            target = path.with_name(path.name + suffix)
+            if len(compressed) < len(data):
+                target.write_bytes(compressed)
+                written += 1
+                print(f"{target.relative_to(build_dir)}: {len(data)} -> {len(compressed)} bytes")
+            else:
+                target.unlink(missing_ok=True)
+                skipped += 1
+    print(f"Wrote {written} compressed variants ({skipped} skipped as not smaller)")
+    if brotli is None:
+        print("brotli is not installed; only gzip variants were written")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('build_dir', nargs='?', default=str(ROOT_DIR.parent / 'frontend' / 'build'))
+    parser.add_argument('--min-size', type=int, default=1024)
+    args = parser.parse_args()
+    precompress(Path(args.build_dir), args.min_size)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,9 +3,15 @@ import shutil
 import uuid
 import bcrypt
 import pymongo
+import random
+import argparse
 import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from dotenv import load_dotenv
+from indexes import INDEXES, index_models
 
 ROOT = Path(__file__).parent
 load_dotenv(ROOT / '.env')
@@ -13,7 +19,196 @@ load_dotenv(ROOT / '.env')
 MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
 DB_NAME = os.environ.get('DB_NAME', 'ems')
 
+# Synthetic data: department -> median salary, role -> salary multiplier
+DEPARTMENTS = {
+    'Engineering': 95000,
+    'Sales': 60000,
+    'Marketing': 62000,
+    'Finance': 75000,
+    'HR': 52000,
+    'Operations': 55000,
+    'Support': 42000,
+    'Legal': 88000,
+}
+ROLES = {
+    'Associate': 0.75,
+    'Analyst': 0.9,
+    'Engineer': 1.0,
+    'Senior Engineer': 1.3,
+    'Lead': 1.5,
+    'Manager': 1.7,
+    'Director': 2.4,
+}
+# Roughly pyramid-shaped org: many associates, few directors
+ROLE_WEIGHTS = [20, 18, 25, 15, 10, 9, 3]
+FIRST_NAMES = ['Aarav', 'Priya', 'Rahul', 'Ananya', 'Vikram', 'Sneha', 'Arjun', 'Kavya', 'Rohan', 'Meera',
+               'John', 'Maria', 'Wei', 'Fatima', 'Lucas', 'Olivia', 'Noah', 'Emma', 'Liam', 'Sofia']
+LAST_NAMES = ['Sharma', 'Reddy', 'Patel', 'Iyer', 'Gupta', 'Nair', 'Khan', 'Singh', 'Rao', 'Das',
+              'Smith', 'Garcia', 'Chen', 'Ali', 'Silva', 'Brown', 'Kim', 'Müller', 'Rossi', 'Novak']
+CITIES = ['Hyderabad', 'Bengaluru', 'Chennai', 'Pune', 'Mumbai', 'Delhi', 'Kolkata', 'Vizag']
+AUDIT_ACTIONS = ['Updated employee details', 'Updated employee details', 'Deleted employee', 'Restored employee']
+USER_ROLES = ['HR', 'HR', 'Manager', 'Admin']
+
+SEED_PASSWORD = os.environ.get('SEED_USER_PASSWORD', 'password123')
+SEED_START = datetime(2012, 1, 1, tzinfo=timezone.utc)
+SEED_END = datetime(2025, 1, 1, tzinfo=timezone.utc)
+# Each block of this many employees has its own RNG seed, so the generated data
+# does not depend on how blocks are spread over worker processes
+SEED_BLOCK = 10000
+
+
+def employee_docs(start: int, end: int, rng: random.Random):
+    """Yield synthetic employees numbered ``start`` (inclusive) to ``end`` (exclusive)."""
+    departments = list(DEPARTMENTS)
+    roles = list(ROLES)
+    span_days = (SEED_END - SEED_START).days
+    for i in range(start, end):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        department = rng.choice(departments)
+        role = rng.choices(roles, weights=ROLE_WEIGHTS)[0]
+        joined = SEED_START + timedelta(days=rng.randrange(span_days), seconds=rng.randrange(86400))
+        salary = DEPARTMENTS[department] * ROLES[role] * rng.lognormvariate(0, 0.18)
+        yield {
+            'id': str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            'emp_code': f"EMP{str(i + 1).zfill(5)}",
+            'name': f"{first} {last}",
+            'email': f"{first.lower()}.{last.lower()}.{i + 1}@example.com",
+            'department': department,
+            'role': role,
+            'salary': round(salary, 2),
+            'join_date': joined.date().isoformat(),
+            'phone': f"+91{rng.randrange(6 * 10**9, 10**10)}",
+            'address': f"{rng.randrange(1, 999)} Main Road, {rng.choice(CITIES)}",
+            'photo': None,
+            'status': 'active' if rng.random() < 0.9 else 'inactive',
+            'created_at': joined.isoformat(),
+            'updated_at': joined.isoformat(),
+        }
+
+
+def audit_docs(employee: dict, rng: random.Random, usernames: list, mean_events: float):
+    """Yield an "added" entry plus a random number of later edits for ``employee``."""
+    created = datetime.fromisoformat(employee['created_at'])
+    yield {
+        'id': str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        'action': 'Added new employee',
+        'employee_id': employee['id'],
+        'employee_name': employee['name'],
+        'user': rng.choice(usernames),
+        'timestamp': created.isoformat(),
+    }
+    remaining = max(0.0, (SEED_END - created).total_seconds())
+    for _ in range(int(rng.expovariate(1 / mean_events)) if mean_events > 0 else 0):
+        yield {
+            'id': str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            'action': rng.choice(AUDIT_ACTIONS),
+            'employee_id': employee['id'],
+            'employee_name': employee['name'],
+            'user': rng.choice(usernames),
+            'timestamp': (created + timedelta(seconds=rng.uniform(0, remaining))).isoformat(),
+        }
+
+
+def _seed_chunk(start: int, end: int, usernames: list, mean_events: float, batch_size: int, seed: int):
+    """Worker process: generate and insert one contiguous range of employees.
+
+    ``start`` must be a multiple of ``SEED_BLOCK``.
+    """
+    client = pymongo.MongoClient(MONGO_URL)
+    db = client[DB_NAME]
+    employees, audits = [], []
+    inserted_audits = 0
+    try:
+        for block_start in range(start, end, SEED_BLOCK):
+            rng = random.Random(f"{seed}:{block_start}")
+            for emp in employee_docs(block_start, min(block_start + SEED_BLOCK, end), rng):
+                employees.append(emp)
+                audits.extend(audit_docs(emp, rng, usernames, mean_events))
+                if len(employees) >= batch_size:
+                    db.employees.insert_many(employees, ordered=False)
+                    employees = []
+                if len(audits) >= batch_size:
+                    db.audit_logs.insert_many(audits, ordered=False)
+                    inserted_audits += len(audits)
+                    audits = []
+        if employees:
+            db.employees.insert_many(employees, ordered=False)
+        if audits:
+            db.audit_logs.insert_many(audits, ordered=False)
+            inserted_audits += len(audits)
+    finally:
+        client.close()
+    return end - start, inserted_audits
+
+
+def _hash_password(password: str) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+
+
+def seed(db, count: int, user_count: int, mean_events: float, workers: int, batch_size: int, seed_value: int):
+    """Bulk-load ``count`` employees plus users and audit history, then build indexes."""
+    started = time.perf_counter()
+    usernames = [f"user{str(i + 1).zfill(4)}" for i in range(user_count)]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # bcrypt is deliberately slow; spread the hashing over all cores
+        hashes = pool.map(_hash_password, [SEED_PASSWORD] * user_count, chunksize=max(1, user_count // (workers * 4)))
+        rng = random.Random(seed_value)
+        users = [{
+            'id': str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            'username': username,
+            'role': rng.choice(USER_ROLES),
+            'password': hashed,
+            'last_login': None,
+            'status': 'active',
+            'failed_attempts': 0,
+        } for username, hashed in zip(usernames, hashes)]
+        if users:
+            db.users.insert_many(users, ordered=False)
+        print(f"Inserted {len(users)} users (password '{SEED_PASSWORD}') in {time.perf_counter() - started:.1f}s")
+
+        # Whole seed blocks per task, roughly four tasks per worker
+        blocks = max(1, -(-count // (workers * 4 * SEED_BLOCK)))
+        chunk = blocks * SEED_BLOCK
+        futures = [
+            pool.submit(_seed_chunk, start, min(start + chunk, count), usernames or ['system'],
+                        mean_events, batch_size, seed_value)
+            for start in range(0, count, chunk)
+        ]
+        total_employees = total_audits = 0
+        for future in futures:
+            employees, audits = future.result()
+            total_employees += employees
+            total_audits += audits
+            print(f"  ... {total_employees}/{count} employees")
+    print(f"Inserted {total_employees} employees and {total_audits} audit entries "
+          f"in {time.perf_counter() - started:.1f}s")
+
+    index_started = time.perf_counter()
+    create_indexes(db)
+    print(f"Indexes built in {time.perf_counter() - index_started:.1f}s")
+
+
+def create_indexes(db):
+    # Built after the bulk load so inserts don't pay for index maintenance
+    for collection in INDEXES:
+        db[collection].create_indexes(index_models(collection))
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Drop the database and recreate the default admin user.")
+    parser.add_argument('--seed', type=int, default=0, metavar='N',
+                        help='also generate N synthetic employees with users and audit history')
+    parser.add_argument('--users', type=int, default=None,
+                        help='number of synthetic users (default: N / 1000, at least 5)')
+    parser.add_argument('--audit-per-employee', type=float, default=2.0,
+                        help='mean number of edit events per employee (default: %(default)s)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='generator processes (default: number of cores)')
+    parser.add_argument('--batch-size', type=int, default=10000, help='documents per insert_many')
+    parser.add_argument('--random-seed', type=int, default=42, help='makes the generated data reproducible (independent of --workers)')
+    args = parser.parse_args()
+
     logging.basicConfig(level=logging.INFO)
     print(f"Connecting to MongoDB at {MONGO_URL}, database '{DB_NAME}'")
     client = pymongo.MongoClient(MONGO_URL)
@@ -49,7 +244,7 @@ def main():
     admin_role = os.environ.get('DEFAULT_ADMIN_ROLE', 'Admin')
 
     # Hash password with bcrypt to match server behavior
-    hashed = bcrypt.hashpw(admin_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    hashed = _hash_password(admin_password)
 
     admin_doc = {
         'id': str(uuid.uuid4()),
@@ -64,71 +259,14 @@ def main():
     users.insert_one(admin_doc)
     print(f"Inserted default admin user: {admin_username}")
 
-    print("Reset complete.")
-
-
-if __name__ == '__main__':
-    main()
-#!/usr/bin/env python
-import os
-import shutil
-from pathlib import Path
-from dotenv import load_dotenv
-from pymongo import MongoClient
-import bcrypt
-
-
-def main():
-    ROOT = Path(__file__).parent
-    load_dotenv(ROOT / '.env')
-
-    mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
-    db_name = os.environ.get('DB_NAME', 'employee_management')
-
-    print(f"Connecting to MongoDB: {mongo_url} (db: {db_name})")
-    client = MongoClient(mongo_url)
-
-    # Drop the database
-    print(f"Dropping database '{db_name}'...")
-    client.drop_database(db_name)
-    print("Database dropped.")
-
-    # Clear uploads directory
-    uploads_dir = ROOT / 'uploads'
-    if uploads_dir.exists() and uploads_dir.is_dir():
-        print(f"Clearing uploads in: {uploads_dir}")
-        for child in uploads_dir.iterdir():
-            try:
-                if child.is_file() or child.is_symlink():
-                    child.unlink()
-                elif child.is_dir():
-                    shutil.rmtree(child)
-            except Exception as e:
-                print(f"  - Failed to remove {child}: {e}")
-        print("Uploads cleared.")
+    if args.seed > 0:
+        user_count = args.users if args.users is not None else max(5, args.seed // 1000)
+        print(f"Seeding {args.seed} employees with {args.workers} workers...")
+        seed(db, args.seed, user_count, args.audit_per_employee,
+             max(1, args.workers), args.batch_size, args.random_seed)
     else:
-        print("Uploads directory not found — skipping.")
-
-    # Recreate minimal database and default admin user
-    db = client[db_name]
-    print("Creating default admin user 'phanendra' with password '123456'...")
-    password_plain = "123456"
-    hashed = bcrypt.hashpw(password_plain.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-
-    admin_doc = {
-        "id": "admin-001",
-        "username": "phanendra",
-        "password": hashed,
-        "role": "Admin",
-        "status": "active",
-        "last_login": None,
-        "failed_attempts": 0
-    }
-
-    res = db.users.insert_one(admin_doc)
-    print(f"Inserted admin user, mongo id: {res.inserted_id}")
+        create_indexes(db)
 
-    # Optional: create indexes or seed collections if desired
     print("Reset complete.")
 
 
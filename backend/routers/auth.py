@@ -0,0 +1,137 @@
+from fastapi import APIRouter, HTTPException, Depends, Request
+from pymongo import ReturnDocument
+from datetime import datetime, timezone
+import asyncio
+import math
+import logging
+import os
+from core import db, hash_password, verify_password, create_token, get_current_user
+from login_throttle import SlidingWindowThrottle
+from models import User, UserCreate, LoginRequest, LoginResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api", tags=["auth"])
+
+MAX_FAILED_ATTEMPTS = 5
+
+# Login flood protection (per worker, sliding window)
+LOGIN_THROTTLE_WINDOW_SECONDS = float(os.environ.get('LOGIN_THROTTLE_WINDOW_SECONDS', '60'))
+user_throttle = SlidingWindowThrottle(
+    int(os.environ.get('LOGIN_MAX_ATTEMPTS_PER_USER', '10')), LOGIN_THROTTLE_WINDOW_SECONDS
+)
+# Keyed on request.client.host, which is the real client address only when
+# uvicorn trusts the proxy's X-Forwarded-For (FORWARDED_ALLOW_IPS, see serve.py)
+client_throttle = SlidingWindowThrottle(
+    int(os.environ.get('LOGIN_MAX_ATTEMPTS_PER_CLIENT', '30')), LOGIN_THROTTLE_WINDOW_SECONDS
+)
+
+# Increment failed_attempts and lock at the threshold in one atomic update
+FAILED_LOGIN_UPDATE = [
+    {"$set": {"failed_attempts": {"$add": [{"$ifNull": ["$failed_attempts", 0]}, 1]}}},
+    {"$set": {"status": {"$cond": [
+        {"$gte": ["$failed_attempts", MAX_FAILED_ATTEMPTS]}, "locked", "$status"
+    ]}}}
+]
+
+# Auth Routes
+@router.post("/auth/register", response_model=User)
+async def register(user_data: UserCreate):
+    # Check if user exists
+    existing = await db.users.find_one({"username": user_data.username})
+    if existing:
+        raise HTTPException(status_code=400, detail="Username already exists")
+    
+    # Create user
+    user = User(
+        username=user_data.username,
+        role=user_data.role
+    )
+    doc = user.model_dump()
+    doc['password'] = hash_password(user_data.password)
+    doc['last_login'] = None
+    
+    await db.users.insert_one(doc)
+    return user
+
+@router.post("/auth/login", response_model=LoginResponse)
+async def login(login_data: LoginRequest, request: Request):
+    try:
+        logger.info(f"Login attempt for username: {login_data.username}")
+        
+        # Reject floods before any database or bcrypt work
+        client_host = request.client.host if request.client else "unknown"
+        retry_after = client_throttle.hit(client_host) or user_throttle.hit(login_data.username)
+        if retry_after is not None:
+            logger.warning(f"Login throttled for '{login_data.username}' from {client_host}")
+            raise HTTPException(
+                status_code=429,
+                detail="Too many login attempts, try again later",
+                headers={"Retry-After": str(math.ceil(retry_after))}
+            )
+        
+        # Find user
+        user_doc = await db.users.find_one({"username": login_data.username})
+        if not user_doc:
+            logger.warning(f"Login failed: User '{login_data.username}' not found")
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+        
+        # Check if account is locked
+        if user_doc.get('status') == 'locked':
+            logger.warning(f"Login failed: Account '{login_data.username}' is locked")
+            raise HTTPException(status_code=403, detail="Account locked due to too many failed attempts")
+        
+        # Verify password (bcrypt releases the GIL; keep it off the event loop)
+        if not await asyncio.to_thread(verify_password, login_data.password, user_doc['password']):
+            # Atomically increment failed attempts and read back the new count
+            updated = await db.users.find_one_and_update(
+                {"username": login_data.username},
+                FAILED_LOGIN_UPDATE,
+                projection={"_id": 0, "failed_attempts": 1},
+                return_document=ReturnDocument.AFTER
+            )
+            failed_attempts = updated.get('failed_attempts', 0) if updated else 0
+            
+            logger.warning(f"Login failed: Invalid password for '{login_data.username}' (attempt {failed_attempts})")
+            raise HTTPException(status_code=401, detail="Invalid credentials")
+        
+        # Reset failed attempts and update last login, unless a concurrent
+        # attempt locked the account meanwhile; returns the fresh user document
+        user_doc = await db.users.find_one_and_update(
+            {"username": login_data.username, "status": {"$ne": "locked"}},
+            {"$set": {
+                "failed_attempts": 0,
+                "last_login": datetime.now(timezone.utc).isoformat()
+            }},
+            projection={"_id": 0, "password": 0},
+            return_document=ReturnDocument.AFTER
+        )
+        if not user_doc:
+            logger.warning(f"Login failed: Account '{login_data.username}' is locked")
+            raise HTTPException(status_code=403, detail="Account locked due to too many failed attempts")
+        
+        user_throttle.reset(login_data.username)
+        logger.info(f"Login successful for user: {login_data.username}")
+        
+        # Create token
+        token = create_token(user_doc['id'], user_doc['username'], user_doc['role'])
+        
+        user = User(**user_doc)
+        
+        return LoginResponse(token=token, user=user)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error during login: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+@router.get("/auth/me", response_model=User)
+async def get_me(current_user: dict = Depends(get_current_user)):
+    user_doc = await db.users.find_one({"id": current_user['user_id']}, {"_id": 0, "password": 0})
+    if not user_doc:
+        raise HTTPException(status_code=404, detail="User not found")
+    return User(**user_doc)
+
+@router.post("/auth/logout")
+async def logout(current_user: dict = Depends(get_current_user)):
+    return {"message": "Logged out successfully"}
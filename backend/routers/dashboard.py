@@ -0,0 +1,142 @@
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from datetime import datetime
+import asyncio
+import os
+from core import (
+    db, employee_cache, get_current_user, create_stream_ticket, get_current_user_from_ticket,
+    STREAM_TICKET_SECONDS,
+)
+from dashboard_stream import DashboardBroadcaster
+from salary_analytics import GROUP_FIELDS, SalaryColumnCache, compute_salary_analytics
+from models import DashboardStats, DepartmentData, SalaryData, DashboardSnapshot, SalaryAnalytics, StreamTicket
+
+router = APIRouter(prefix="/api", tags=["dashboard"])
+
+# Dashboard Routes
+async def compute_dashboard_stats() -> DashboardStats:
+    # Calculate average salary
+    pipeline = [
+        {"$group": {"_id": None, "avg_salary": {"$avg": "$salary"}}}
+    ]
+    total, active, departments, result = await asyncio.gather(
+        db.employees.count_documents({}),
+        db.employees.count_documents({"status": "active"}),
+        db.employees.distinct("department"),
+        db.employees.aggregate(pipeline).to_list(1)
+    )
+    avg_salary = result[0]['avg_salary'] if result else 0
+    
+    return DashboardStats(
+        total_employees=total,
+        active_employees=active,
+        department_count=len(departments),
+        average_salary=round(avg_salary, 2)
+    )
+
+async def compute_department_data() -> List[dict]:
+    pipeline = [
+        {"$group": {"_id": "$department", "count": {"$sum": 1}}},
+        {"$project": {"department": "$_id", "count": 1, "_id": 0}}
+    ]
+    return await db.employees.aggregate(pipeline).to_list(100)
+
+async def compute_salary_data() -> List[dict]:
+    pipeline = [
+        {"$group": {"_id": "$department", "average_salary": {"$avg": "$salary"}}},
+        {"$project": {"department": "$_id", "average_salary": 1, "_id": 0}}
+    ]
+    result = await db.employees.aggregate(pipeline).to_list(100)
+    
+    # Round salaries
+    for item in result:
+        item['average_salary'] = round(item['average_salary'], 2)
+    
+    return result
+
+async def compute_recent_activities() -> List[dict]:
+    logs = await db.audit_logs.find({}, {"_id": 0}).sort("timestamp", -1).limit(5).to_list(5)
+    
+    for log in logs:
+        if isinstance(log.get('timestamp'), str):
+            log['timestamp'] = datetime.fromisoformat(log['timestamp'])
+    
+    return logs
+
+async def compute_dashboard_snapshot() -> DashboardSnapshot:
+    stats, department_data, salary_data, recent_activities = await asyncio.gather(
+        compute_dashboard_stats(),
+        compute_department_data(),
+        compute_salary_data(),
+        compute_recent_activities()
+    )
+    return DashboardSnapshot(
+        stats=stats,
+        department_data=department_data,
+        salary_data=salary_data,
+        recent_activities=recent_activities
+    )
+
+async def compute_dashboard_snapshot_json() -> dict:
+    return jsonable_encoder(await compute_dashboard_snapshot())
+
+# One broadcaster per worker, refreshed whenever any worker changes an employee
+dashboard_broadcaster = DashboardBroadcaster(compute_dashboard_snapshot_json)
+employee_cache.add_listener(dashboard_broadcaster.notify)
+
+# Salary columns loaded once per worker, dropped on any employee write (or after the TTL)
+salary_columns = SalaryColumnCache(db, ttl=float(os.environ.get('SALARY_CACHE_TTL_SECONDS', '300')))
+employee_cache.add_listener(salary_columns.invalidate)
+
+@router.get("/dashboard/stats", response_model=DashboardStats)
+async def get_dashboard_stats(current_user: dict = Depends(get_current_user)):
+    return await compute_dashboard_stats()
+
+@router.get("/dashboard/department-data", response_model=List[DepartmentData])
+async def get_department_data(current_user: dict = Depends(get_current_user)):
+    return await compute_department_data()
+
+@router.get("/dashboard/salary-data", response_model=List[SalaryData])
+async def get_salary_data(current_user: dict = Depends(get_current_user)):
+    return await compute_salary_data()
+
+@router.get("/dashboard/recent-activities")
+async def get_recent_activities(current_user: dict = Depends(get_current_user)):
+    return await compute_recent_activities()
+
+@router.get("/dashboard/snapshot", response_model=DashboardSnapshot)
+async def get_dashboard_snapshot(current_user: dict = Depends(get_current_user)):
+    """All dashboard panels in one request, computed concurrently"""
+    return await compute_dashboard_snapshot()
+
+@router.post("/dashboard/stream-ticket", response_model=StreamTicket)
+async def get_stream_ticket(current_user: dict = Depends(get_current_user)):
+    """Short-lived ticket for opening /dashboard/stream?ticket=..."""
+    return StreamTicket(ticket=create_stream_ticket(current_user), expires_in=STREAM_TICKET_SECONDS)
+
+@router.get("/dashboard/stream")
+async def stream_dashboard(current_user: dict = Depends(get_current_user_from_ticket)):
+    """Server-sent events: a full snapshot, then changed panels as employees change"""
+    return StreamingResponse(
+        dashboard_broadcaster.stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/dashboard/salary-analytics", response_model=SalaryAnalytics)
+async def get_salary_analytics(
+    group_by: str = "department",
+    bins: int = 20,
+    status: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    """Salary percentiles, histograms and IQR outlier bands per department or role"""
+    if group_by not in GROUP_FIELDS:
+        raise HTTPException(status_code=400, detail=f"group_by must be one of: {', '.join(GROUP_FIELDS)}")
+    if not 1 <= bins <= 200:
+        raise HTTPException(status_code=400, detail="bins must be between 1 and 200")
+    
+    columns = await salary_columns.columns()
+    return compute_salary_analytics(columns, group_by, bins, status)
@@ -0,0 +1,271 @@
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from pymongo.errors import DuplicateKeyError
+import logging
+from core import db, employee_cache, get_current_user, generate_emp_code, create_audit_log, build_employee_query, build_employee_sort
+from indexes import SORT_COLLATION
+from models import Employee, EmployeeCreate, EmployeeUpdate, EmployeeBatchRequest, EmployeeBatchResponse
+
+router = APIRouter(prefix="/api", tags=["employees"])
+
+MAX_BATCH_IDS = 500
+
+def parse_employee_fields(fields: Optional[str]) -> Optional[Dict[str, int]]:
+    # "id,name" -> Mongo projection; None means the full document
+    if not fields:
+        return None
+    requested = [f.strip() for f in fields.split(',') if f.strip()]
+    unknown = [f for f in requested if f not in Employee.model_fields]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(Employee.model_fields)}"
+        )
+    projection = {"_id": 0, "id": 1}
+    projection.update({f: 1 for f in requested})
+    return projection
+
+# Employee Routes
+@router.post("/employees/add", response_model=Employee)
+async def add_employee(employee_data: EmployeeCreate, current_user: dict = Depends(get_current_user)):
+    # Check if email exists
+    existing = await db.employees.find_one({"email": employee_data.email})
+    if existing:
+        raise HTTPException(status_code=400, detail="Email already exists")
+    
+    # Generate employee code
+    emp_code = await generate_emp_code()
+    
+    # Create employee
+    employee = Employee(
+        emp_code=emp_code,
+        **employee_data.model_dump()
+    )
+    
+    doc = employee.model_dump()
+    doc['created_at'] = doc['created_at'].isoformat()
+    doc['updated_at'] = doc['updated_at'].isoformat()
+    
+    try:
+        await db.employees.insert_one(doc)
+    except DuplicateKeyError:
+        # Databases prepared by reset_db.py have unique email/emp_code indexes
+        raise HTTPException(status_code=400, detail="Email or employee code already exists")
+    # Nothing is cached for a new id, but this tells other workers' listeners
+    await employee_cache.invalidate(employee.id)
+    
+    # Create audit log
+    await create_audit_log(
+        action="Added new employee",
+        user=current_user['username'],
+        employee_id=employee.id,
+        employee_name=employee.name
+    )
+    
+    # Mock email notification
+    logging.info(f"[MOCK EMAIL] New employee added: {employee.name} ({employee.email})")
+    
+    return employee
+
+@router.get("/employees/list", response_model=List[Employee])
+async def list_employees(
+    page: int = 1,
+    limit: int = 10,
+    search: Optional[str] = None,
+    department: Optional[str] = None,
+    status: Optional[str] = None,
+    sort_by: str = "name",
+    sort_order: str = "asc",
+    fields: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    projection = parse_employee_fields(fields)
+    sort = build_employee_sort(sort_by, sort_order)
+    
+    # Build query
+    query = build_employee_query(search, department, status)
+    
+    # Calculate skip
+    skip = (page - 1) * limit
+    
+    # Fetch employees; the collation must match the sort index
+    employees = await db.employees.find(query, projection or {"_id": 0}).collation(SORT_COLLATION).sort(sort).skip(skip).limit(limit).to_list(limit)
+    
+    # Sparse fieldsets skip model validation
+    if projection:
+        return JSONResponse(jsonable_encoder(employees))
+    
+    # Convert datetime strings
+    for emp in employees:
+        if isinstance(emp.get('created_at'), str):
+            emp['created_at'] = datetime.fromisoformat(emp['created_at'])
+        if isinstance(emp.get('updated_at'), str):
+            emp['updated_at'] = datetime.fromisoformat(emp['updated_at'])
+    
+    return employees
+
+@router.get("/employees/count")
+async def count_employees(
+    search: Optional[str] = None,
+    department: Optional[str] = None,
+    status: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    query = build_employee_query(search, department, status)
+    
+    # Same collation as list_employees so both agree on matches
+    count = await db.employees.count_documents(query, collation=SORT_COLLATION)
+    return {"count": count}
+
+@router.post("/employees/batch", response_model=EmployeeBatchResponse)
+async def get_employees_batch(request: EmployeeBatchRequest, current_user: dict = Depends(get_current_user)):
+    """Resolve many employee ids in one round trip, keyed by id"""
+    ids = list(dict.fromkeys(request.ids))
+    if len(ids) > MAX_BATCH_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_IDS} ids per request")
+    projection = parse_employee_fields(request.fields)
+    
+    # Cached records first; a single $in over the id index for the rest
+    found = {}
+    for employee_id in ids:
+        cached = employee_cache.peek(employee_id)
+        if cached is not None:
+            found[employee_id] = cached
+    remaining = [i for i in ids if i not in found]
+    if remaining:
+        cursor = db.employees.find({"id": {"$in": remaining}}, projection or {"_id": 0})
+        async for doc in cursor:
+            found[doc['id']] = doc
+    
+    missing = [i for i in ids if i not in found]
+    if projection:
+        fields = [f for f in projection if f != "_id"]
+        employees = {i: {f: found[i].get(f) for f in fields} for i in ids if i in found}
+        return JSONResponse(jsonable_encoder({"employees": employees, "missing": missing}))
+    
+    return EmployeeBatchResponse(
+        employees={i: found[i] for i in ids if i in found},
+        missing=missing
+    )
+
+@router.get("/employees/{employee_id}", response_model=Employee)
+async def get_employee(
+    employee_id: str,
+    fields: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    projection = parse_employee_fields(fields)
+    if projection:
+        # Serve from the cache if the record is there; otherwise a projected read,
+        # which the (id, name, emp_code, department) index covers for lookups
+        employee = employee_cache.peek(employee_id)
+        if employee is None:
+            employee = await db.employees.find_one({"id": employee_id}, projection)
+        if not employee:
+            raise HTTPException(status_code=404, detail="Employee not found")
+        return JSONResponse(jsonable_encoder({f: employee.get(f) for f in projection if f != "_id"}))
+    
+    employee = await employee_cache.get(employee_id)
+    if not employee:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    
+    return Employee(**employee)
+
+@router.put("/employees/{employee_id}", response_model=Employee)
+async def update_employee(
+    employee_id: str,
+    employee_data: EmployeeUpdate,
+    current_user: dict = Depends(get_current_user)
+):
+    # Check if employee exists
+    existing = await db.employees.find_one({"id": employee_id})
+    if not existing:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    
+    # Update data
+    update_data = {k: v for k, v in employee_data.model_dump().items() if v is not None}
+    update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
+    
+    try:
+        await db.employees.update_one(
+            {"id": employee_id},
+            {"$set": update_data}
+        )
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already exists")
+    await employee_cache.invalidate(employee_id)
+    
+    # Create audit log
+    await create_audit_log(
+        action="Updated employee details",
+        user=current_user['username'],
+        employee_id=employee_id,
+        employee_name=existing['name']
+    )
+    
+    # Mock email notification
+    logging.info(f"[MOCK EMAIL] Employee updated: {existing['name']} ({existing['email']})")
+    
+    # Fetch updated employee
+    updated_employee = await db.employees.find_one({"id": employee_id}, {"_id": 0})
+    
+    if isinstance(updated_employee.get('created_at'), str):
+        updated_employee['created_at'] = datetime.fromisoformat(updated_employee['created_at'])
+    if isinstance(updated_employee.get('updated_at'), str):
+        updated_employee['updated_at'] = datetime.fromisoformat(updated_employee['updated_at'])
+    
+    return Employee(**updated_employee)
+
+@router.delete("/employees/{employee_id}")
+async def delete_employee(employee_id: str, current_user: dict = Depends(get_current_user)):
+    # Soft delete
+    employee = await db.employees.find_one({"id": employee_id})
+    if not employee:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    
+    await db.employees.update_one(
+        {"id": employee_id},
+        {"$set": {"status": "inactive", "updated_at": datetime.now(timezone.utc).isoformat()}}
+    )
+    await employee_cache.invalidate(employee_id)
+    
+    # Create audit log
+    await create_audit_log(
+        action="Deleted employee",
+        user=current_user['username'],
+        employee_id=employee_id,
+        employee_name=employee['name']
+    )
+    
+    return {"message": "Employee deleted successfully"}
+
+@router.post("/employees/{employee_id}/restore")
+async def restore_employee(employee_id: str, current_user: dict = Depends(get_current_user)):
+    employee = await db.employees.find_one({"id": employee_id})
+    if not employee:
+        raise HTTPException(status_code=404, detail="Employee not found")
+    
+    await db.employees.update_one(
+        {"id": employee_id},
+        {"$set": {"status": "active", "updated_at": datetime.now(timezone.utc).isoformat()}}
+    )
+    await employee_cache.invalidate(employee_id)
+    
+    # Create audit log
+    await create_audit_log(
+        action="Restored employee",
+        user=current_user['username'],
+        employee_id=employee_id,
+        employee_name=employee['name']
+    )
+    
+    return {"message": "Employee restored successfully"}
+
+# Get departments list
+@router.get("/departments")
+async def get_departments(current_user: dict = Depends(get_current_user)):
+    departments = await db.employees.distinct("department")
+    return {"departments": departments}
@@ -0,0 +1,198 @@
+"""Export routes.
+
+ReportLab and xlsxwriter are only needed here and are slow to import, so they
+are loaded on the first export request rather than at worker start.
+"""
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from datetime import datetime, timezone
+from io import BytesIO, StringIO
+import csv
+from core import db, get_current_user, build_employee_query, build_employee_sort
+from indexes import SORT_COLLATION
+
+router = APIRouter(prefix="/api", tags=["export"])
+
+EXPORT_LIMIT = 10000
+
+# Exportable fields: key -> (header, PDF header, PDF column width in inches)
+EXPORT_COLUMNS = {
+    'emp_code': ('Emp Code', 'Code', 0.8),
+    'name': ('Name', 'Name', 1.2),
+    'email': ('Email', 'Email', 1.5),
+    'department': ('Department', 'Dept', 1.0),
+    'role': ('Role', 'Role', 1.0),
+    'salary': ('Salary', 'Salary', 1.0),
+    'join_date': ('Join Date', 'Joined', 0.9),
+    'phone': ('Phone', 'Phone', 1.0),
+    'address': ('Address', 'Address', 1.5),
+    'status': ('Status', 'Status', 0.7),
+}
+DEFAULT_COLUMNS = ['emp_code', 'name', 'email', 'department', 'role', 'salary', 'join_date', 'phone', 'status']
+DEFAULT_PDF_COLUMNS = ['emp_code', 'name', 'email', 'department', 'role', 'salary']
+
+def export_filters(
+    search: Optional[str] = None,
+    department: Optional[str] = None,
+    status: Optional[str] = "active",
+    sort_by: str = "name",
+    sort_order: str = "asc",
+    columns: Optional[str] = None
+) -> dict:
+    # Same filters as /employees/list; pass status= (empty) to include inactive employees
+    selected = None
+    if columns:
+        selected = [c.strip() for c in columns.split(',') if c.strip()]
+        unknown = [c for c in selected if c not in EXPORT_COLUMNS]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown columns: {', '.join(unknown)}. Allowed: {', '.join(EXPORT_COLUMNS)}"
+            )
+    return {
+        "query": build_employee_query(search, department, status),
+        "sort": build_employee_sort(sort_by, sort_order),
+        "columns": selected
+    }
+
+async def fetch_export_rows(filters: dict, columns: List[str]) -> List[dict]:
+    # Filter and columns are pushed down to Mongo: only matching rows, only requested fields
+    projection = {"_id": 0, **{c: 1 for c in columns}}
+    cursor = db.employees.find(filters["query"], projection).collation(SORT_COLLATION).sort(filters["sort"])
+    return await cursor.limit(EXPORT_LIMIT).to_list(EXPORT_LIMIT)
+
+# Export Routes
+@router.get("/export/csv")
+async def export_csv(filters: dict = Depends(export_filters), current_user: dict = Depends(get_current_user)):
+    columns = filters["columns"] or DEFAULT_COLUMNS
+    employees = await fetch_export_rows(filters, columns)
+    
+    # Create CSV using StringIO for text handling
+    output = StringIO()
+    writer = csv.writer(output)
+    
+    # Headers
+    writer.writerow([EXPORT_COLUMNS[c][0] for c in columns])
+    
+    # Data
+    for emp in employees:
+        writer.writerow([emp.get(c, '') for c in columns])
+    
+    # Convert to bytes with UTF-8 BOM
+    csv_content = '\ufeff' + output.getvalue()  # Add BOM
+    csv_bytes = BytesIO(csv_content.encode('utf-8'))
+    csv_bytes.seek(0)
+    
+    return StreamingResponse(
+        csv_bytes,
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=employees.csv"}
+    )
+
+@router.get("/export/excel")
+async def export_excel(filters: dict = Depends(export_filters), current_user: dict = Depends(get_current_user)):
+    columns = filters["columns"] or DEFAULT_COLUMNS
+    employees = await fetch_export_rows(filters, columns)
+    
+    import xlsxwriter
+    
+    # Create Excel
+    output = BytesIO()
+    workbook = xlsxwriter.Workbook(output)
+    worksheet = workbook.add_worksheet('Employees')
+    
+    # Header format
+    header_format = workbook.add_format({
+        'bold': True,
+        'bg_color': '#4472C4',
+        'font_color': 'white',
+        'border': 1
+    })
+    
+    # Headers
+    for col, key in enumerate(columns):
+        worksheet.write(0, col, EXPORT_COLUMNS[key][0], header_format)
+    
+    # Data
+    for row, emp in enumerate(employees, start=1):
+        for col, key in enumerate(columns):
+            worksheet.write(row, col, emp.get(key, ''))
+    
+    workbook.close()
+    output.seek(0)
+    
+    return StreamingResponse(
+        output,
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers={"Content-Disposition": "attachment; filename=employees.xlsx"}
+    )
+
+@router.get("/export/pdf")
+async def export_pdf(filters: dict = Depends(export_filters), current_user: dict = Depends(get_current_user)):
+    columns = filters["columns"] or DEFAULT_PDF_COLUMNS
+    employees = await fetch_export_rows(filters, columns)
+    
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER
+    
+    # Create PDF
+    output = BytesIO()
+    doc = SimpleDocTemplate(output, pagesize=letter)
+    elements = []
+    
+    # Styles
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1f2937'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+    
+    # Title
+    elements.append(Paragraph("Employee Report", title_style))
+    elements.append(Paragraph(f"Generated on: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC", styles['Normal']))
+    elements.append(Paragraph(f"Generated by: {current_user['username']}", styles['Normal']))
+    elements.append(Spacer(1, 0.5*inch))
+    
+    # Table data
+    data = [[EXPORT_COLUMNS[c][1] for c in columns]]
+    
+    for emp in employees:
+        data.append([
+            f"${emp.get('salary') or 0:,.2f}" if c == 'salary' else emp.get(c, '')
+            for c in columns
+        ])
+    
+    # Create table, scaled down if the selected columns are wider than the page
+    widths = [EXPORT_COLUMNS[c][2] for c in columns]
+    scale = min(1.0, 6.5 / sum(widths))
+    table = Table(data, colWidths=[w * scale * inch for w in widths])
+    table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4472C4')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+    ]))
+    
+    elements.append(table)
+    doc.build(elements)
+    output.seek(0)
+    
+    return StreamingResponse(
+        output,
+        media_type="application/pdf",
+        headers={"Content-Disposition": "attachment; filename=employees.pdf"}
+    )
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, UploadFile, File
+import uuid
+import shutil
+from core import UPLOADS_DIR, get_current_user
+
+router = APIRouter(prefix="/api", tags=["uploads"])
+
+# Upload Route
+@router.post("/upload")
+async def upload_file(file: UploadFile = File(...), current_user: dict = Depends(get_current_user)):
+    # Generate unique filename
+    file_ext = file.filename.split('.')[-1]
+    filename = f"{uuid.uuid4()}.{file_ext}"
+    file_path = UPLOADS_DIR / filename
+    
+    # Save file
+    with open(file_path, "wb") as buffer:
+        shutil.copyfileobj(file.file, buffer)
+    
+    return {"filename": filename, "url": f"/api/uploads/{filename}"}
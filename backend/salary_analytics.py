@@ -0,0 +1,150 @@
+"""Salary distribution analytics over an in-memory, array-backed column cache.
+
+The salary, department, role and status columns are read from Mongo once into
+NumPy arrays (strings are dictionary-encoded as small integer codes) and kept
+until an employee write invalidates them, or at most ``ttl`` seconds as a
+safety net should a change notification be missed. Per-group percentiles, histograms and
+IQR outlier bands are then computed with vectorized operations instead of
+aggregation round trips. NumPy is imported on first use to keep it out of
+worker start-up.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+GROUP_FIELDS = ('department', 'role')
+LOAD_BATCH_SIZE = 10000
+
+
+class SalaryColumns:
+    """One snapshot of the columns: salaries plus integer-coded categories."""
+
+    def __init__(self, salaries, codes: Dict[str, Any], labels: Dict[str, List[str]]):
+        self.salaries = salaries
+        self.codes = codes
+        self.labels = labels
+
+
+class SalaryColumnCache:
+    def __init__(self, db, ttl: float = 300):
+        self.db = db
+        self.ttl = ttl
+        self._columns: Optional[SalaryColumns] = None
+        self._loaded_at = 0.0
+        self._version = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self, *_):
+        self._version += 1
+        self._columns = None
+
+    def _fresh(self) -> bool:
+        return self._columns is not None and time.monotonic() - self._loaded_at < self.ttl
+
+    async def columns(self) -> SalaryColumns:
+        if self._fresh():
+            return self._columns
+        async with self._lock:
+            # Another request may have loaded it while we waited
+            if not self._fresh():
+                version = self._version
+                loaded_at = time.monotonic()
+                columns = await self._load()
+                if version == self._version:
+                    self._columns, self._loaded_at = columns, loaded_at
+                return columns
+            return self._columns
+
+    async def _load(self) -> SalaryColumns:
+        import numpy as np
+
+        fields = ('status',) + GROUP_FIELDS
+        salaries: List[float] = []
+        raw: Dict[str, List[Any]] = {f: [] for f in fields}
+        projection = {"_id": 0, "salary": 1, **{f: 1 for f in fields}}
+        cursor = self.db.employees.find({"salary": {"$type": "number"}}, projection).batch_size(LOAD_BATCH_SIZE)
+        async for doc in cursor:
+            salaries.append(doc['salary'])
+            for f in fields:
+                raw[f].append(doc.get(f) or 'Unknown')
+
+        codes, labels = {}, {}
+        for f in fields:
+            uniques, inverse = np.unique(np.array(raw[f], dtype=object).astype(str), return_inverse=True)
+            labels[f] = uniques.tolist()
+            codes[f] = inverse.astype(np.int32)
+        logger.info(f"Loaded salary column cache: {len(salaries)} employees")
+        return SalaryColumns(np.asarray(salaries, dtype=np.float64), codes, labels)
+
+
+def _distribution(values) -> Dict[str, float]:
+    """Summary statistics and IQR outlier bands for a non-empty sorted array."""
+    import numpy as np
+
+    p10, p25, p50, p75, p90 = np.percentile(values, [10, 25, 50, 75, 90])
+    iqr = p75 - p25
+    lower_fence, upper_fence = p25 - 1.5 * iqr, p75 + 1.5 * iqr
+    return {
+        'count': int(values.size),
+        'mean': round(float(values.mean()), 2),
+        'min': round(float(values[0]), 2),
+        'p10': round(float(p10), 2),
+        'p25': round(float(p25), 2),
+        'median': round(float(p50), 2),
+        'p75': round(float(p75), 2),
+        'p90': round(float(p90), 2),
+        'max': round(float(values[-1]), 2),
+        'lower_fence': round(float(lower_fence), 2),
+        'upper_fence': round(float(upper_fence), 2),
+        # values is sorted, so the outlier counts are two binary searches
+        'outliers_low': int(np.searchsorted(values, lower_fence, side='left')),
+        'outliers_high': int(values.size - np.searchsorted(values, upper_fence, side='right')),
+    }
+
+
+def compute_salary_analytics(columns: SalaryColumns, group_by: str, bins: int,
+                             status: Optional[str] = None) -> Dict[str, Any]:
+    import numpy as np
+
+    salaries = columns.salaries
+    groups = columns.codes[group_by]
+    if status:
+        status_labels = columns.labels['status']
+        status_code = status_labels.index(status) if status in status_labels else -1
+        mask = columns.codes['status'] == status_code
+        salaries, groups = salaries[mask], groups[mask]
+
+    labels = columns.labels[group_by]
+    if salaries.size == 0:
+        return {'group_by': group_by, 'bin_edges': [], 'overall': None, 'groups': []}
+
+    # One shared set of bin edges so histograms are comparable across groups
+    bin_edges = np.histogram_bin_edges(salaries, bins=bins)
+    bin_index = np.clip(np.searchsorted(bin_edges, salaries, side='right') - 1, 0, bins - 1)
+    histograms = np.bincount(groups * bins + bin_index, minlength=len(labels) * bins).reshape(len(labels), bins)
+
+    # Sort by (group, salary) once; each group is then a contiguous sorted slice
+    order = np.lexsort((salaries, groups))
+    sorted_salaries = salaries[order]
+    bounds = np.searchsorted(groups[order], np.arange(len(labels) + 1))
+
+    result_groups = []
+    for code, label in enumerate(labels):
+        start, end = bounds[code], bounds[code + 1]
+        if start == end:
+            continue
+        result_groups.append({
+            'group': label,
+            **_distribution(sorted_salaries[start:end]),
+            'histogram': histograms[code].tolist(),
+        })
+
+    return {
+        'group_by': group_by,
+        'bin_edges': [round(float(e), 2) for e in bin_edges],
+        'overall': {'group': 'All', **_distribution(np.sort(salaries)), 'histogram': histograms.sum(axis=0).tolist()},
+        'groups': result_groups,
+    }
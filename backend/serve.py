@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""Production launcher: runs the API under uvicorn with one worker per core.
+
+Settings come from the environment (or backend/.env):
+    PORT          listen port (default 8000)
+    HOST          bind address (default 0.0.0.0)
+    WEB_CONCURRENCY  number of worker processes (default: CPUs available to
+                  this process, at most MAX_DEFAULT_WORKERS). Each worker has
+                  its own MongoDB pool (MONGO_MIN_POOL_SIZE..MONGO_MAX_POOL_SIZE
+                  connections), so size this against the instance's memory
+                  and the cluster's connection limit.
+    FORWARDED_ALLOW_IPS  comma separated proxy addresses whose X-Forwarded-For
+                  is trusted (default 127.0.0.1). Behind a load balancer such
+                  as Render's, set it to the balancer's addresses or "*" when
+                  the app is only reachable through it; otherwise every
+                  client appears as the balancer and shares one login
+                  throttle bucket.
+"""
+import os
+from pathlib import Path
+
+import uvicorn
+from dotenv import load_dotenv
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+
+# Containers often report the host's cores; don't fan out past this by default
+MAX_DEFAULT_WORKERS = 4
+
+
+def default_workers() -> int:
+    # sched_getaffinity honours CPU pinning (Linux only); cpu_count is the host's total
+    if hasattr(os, 'sched_getaffinity'):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    return max(1, min(cpus, MAX_DEFAULT_WORKERS))
+
+
+def main():
+    workers = int(os.environ.get('WEB_CONCURRENCY') or default_workers())
+    uvicorn.run(
+        'server:app',
+        host=os.environ.get('HOST', '0.0.0.0'),
+        port=int(os.environ.get('PORT', '8000')),
+        workers=workers,
+        app_dir=str(ROOT_DIR),
+        proxy_headers=True,
+        forwarded_allow_ips=os.environ.get('FORWARDED_ALLOW_IPS', '127.0.0.1'),
+    )
+
+
+if __name__ == '__main__':
+    main()
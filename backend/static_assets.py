@@ -0,0 +1,96 @@
+"""Serving the built frontend from the API process, plus response compression.
+
+``frontend_router`` serves a React build directory: hashed files under
+``static/`` get immutable cache headers and, when ``precompress.py`` has
+produced ``.br``/``.gz`` siblings, the smallest variant the client accepts is
+sent as-is. Any other non-API GET falls back to ``index.html`` for client-side
+routing.
+
+``CompressionMiddleware`` gzips dynamic responses above a size threshold and
+leaves alone paths that are already compressed or must not be buffered.
+"""
+import mimetypes
+from pathlib import Path
+from typing import Iterable, Optional
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
+from starlette.middleware.gzip import GZipMiddleware
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+NO_CACHE = "no-cache"
+
+# Accept-Encoding token -> file suffix, in order of preference
+PRECOMPRESSED_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _accepted_encodings(request: Request) -> set:
+    accepted = set()
+    for part in request.headers.get("accept-encoding", "").split(","):
+        token, _, params = part.strip().partition(";")
+        if token and params.replace(" ", "") not in ("q=0", "q=0.0"):
+            accepted.add(token.lower())
+    return accepted
+
+
+def _resolve(build_dir: Path, path: str) -> Optional[Path]:
+    candidate = (build_dir / path).resolve()
+    if build_dir not in candidate.parents and candidate != build_dir:
+        return None
+    return candidate if candidate.is_file() else None
+
+
+def serve_asset(request: Request, file_path: Path, cache_control: str, precompressed: bool = True) -> FileResponse:
+    media_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+    headers = {"Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    accepted = _accepted_encodings(request) if precompressed else set()
+    for encoding, suffix in PRECOMPRESSED_VARIANTS:
+        variant = file_path.with_name(file_path.name + suffix)
+        if encoding in accepted and variant.is_file():
+            headers["Content-Encoding"] = encoding
+            return FileResponse(variant, media_type=media_type, headers=headers)
+    return FileResponse(file_path, media_type=media_type, headers=headers)
+
+
+def frontend_router(build_dir: Path) -> APIRouter:
+    build_dir = build_dir.resolve()
+    index_file = build_dir / "index.html"
+    router = APIRouter(include_in_schema=False)
+
+    @router.get("/static/{path:path}")
+    async def static_asset(path: str, request: Request):
+        # Build output under static/ is content-hashed, so it never changes
+        file_path = _resolve(build_dir, f"static/{path}")
+        if file_path is None:
+            raise HTTPException(status_code=404, detail="Not found")
+        return serve_asset(request, file_path, IMMUTABLE_CACHE)
+
+    @router.get("/{path:path}")
+    async def spa(path: str, request: Request):
+        if path == "api" or path.startswith("api/"):
+            raise HTTPException(status_code=404, detail="Not Found")
+        # Top-level files (manifest.json, favicon.ico, ...) are not hashed
+        file_path = _resolve(build_dir, path) if path else None
+        if file_path is None:
+            if not index_file.is_file():
+                raise HTTPException(status_code=404, detail="Frontend build not found")
+            file_path = index_file
+        # Left to CompressionMiddleware; only static/ has precompressed variants
+        return serve_asset(request, file_path, NO_CACHE, precompressed=False)
+
+    return router
+
+
+class CompressionMiddleware:
+    """GZip for dynamic responses, skipping the given path prefixes."""
+
+    def __init__(self, app, minimum_size: int = 1024, exclude_prefixes: Iterable[str] = ()):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+        self.exclude_prefixes = tuple(exclude_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and not scope["path"].startswith(self.exclude_prefixes):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
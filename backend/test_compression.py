@@ -0,0 +1,36 @@
+import asyncio
+import os
+
+# Import-time client creation must not resolve the deployment's SRV record
+os.environ['MONGO_URL'] = 'mongodb://localhost:27017'
+
+import httpx  # noqa: E402
+
+import server  # noqa: E402
+
+
+def fetch(path):
+    async def run():
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://test') as client:
+            return await client.get(path, headers={'Accept-Encoding': 'gzip'})
+    return asyncio.run(run())
+
+
+def test_small_response_is_not_compressed():
+    response = fetch('/api/health')
+    assert response.status_code == 200
+    assert len(response.content) < server.GZIP_MIN_SIZE
+    assert 'content-encoding' not in response.headers
+
+
+def test_small_error_response_is_not_compressed():
+    response = fetch('/api/auth/me')
+    assert response.status_code in (401, 403)
+    assert 'content-encoding' not in response.headers
+
+
+def test_large_response_is_compressed():
+    response = fetch('/openapi.json')
+    assert response.status_code == 200
+    assert response.headers['content-encoding'] == 'gzip'
@@ -0,0 +1,67 @@
+from login_throttle import SlidingWindowThrottle
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_throttle(limit=3, window=60, max_keys=100):
+    clock = FakeClock()
+    return SlidingWindowThrottle(limit, window, max_keys=max_keys, clock=clock), clock
+
+
+def test_allows_up_to_limit_then_rejects_with_retry_after():
+    throttle, clock = make_throttle(limit=3, window=60)
+    for _ in range(3):
+        assert throttle.hit('alice') is None
+        clock.now += 1
+    # First hit was at 1000, now is 1003: 57s until it leaves the window
+    assert throttle.hit('alice') == 57
+    assert throttle.hit('bob') is None
+
+
+def test_hits_expire_after_window():
+    throttle, clock = make_throttle(limit=2, window=60)
+    assert throttle.hit('alice') is None
+    assert throttle.hit('alice') is None
+    assert throttle.hit('alice') is not None
+    clock.now += 60
+    assert throttle.hit('alice') is None
+
+
+def test_idle_keys_are_dropped():
+    throttle, clock = make_throttle(window=60)
+    throttle.hit('alice')
+    clock.now += 30
+    throttle.hit('bob')
+    clock.now += 31
+    throttle.hit('carol')
+    # alice's only hit is out of the window; bob's is not
+    assert len(throttle) == 2
+    clock.now += 60
+    throttle.hit('carol')
+    assert len(throttle) == 1
+
+
+def test_least_recently_active_keys_are_evicted_past_max_keys():
+    throttle, clock = make_throttle(limit=1, max_keys=3)
+    for key in ('a', 'b', 'c'):
+        throttle.hit(key)
+        clock.now += 1
+    throttle.hit('d')
+    assert len(throttle) == 3
+    # 'a' was evicted, so its limit starts over; 'b' is still tracked
+    assert throttle.hit('b') is not None
+    assert throttle.hit('a') is None
+
+
+def test_reset_clears_key():
+    throttle, _ = make_throttle(limit=1)
+    throttle.hit('alice')
+    assert throttle.hit('alice') is not None
+    throttle.reset('alice')
+    assert throttle.hit('alice') is None
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useCallback } from 'react';
 import { useNavigate } from 'react-router-dom';
 import axios from 'axios';
 import '../styles/DashboardPage.css';
@@ -14,26 +14,22 @@ function DashboardPage({ user, onLogout }) {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
 
-  useEffect(() => {
-    fetchDashboardData();
+  // Apply a full snapshot or a delta containing only the panels that changed
+  const applySnapshot = useCallback((data) => {
+    if (data.stats) setStats(data.stats);
+    if (data.department_data) setDepartmentData(data.department_data);
+    if (data.salary_data) setSalaryData(data.salary_data);
+    if (data.recent_activities) setRecentActivities(data.recent_activities);
   }, []);
 
-  const fetchDashboardData = async () => {
+  const fetchDashboardData = useCallback(async () => {
     try {
       const token = localStorage.getItem('token');
       const headers = { Authorization: `Bearer ${token}` };
 
-      const [statsRes, deptRes, salaryRes, activitiesRes] = await Promise.all([
-        axios.get(`${BACKEND_URL}/api/dashboard/stats`, { headers }),
-        axios.get(`${BACKEND_URL}/api/dashboard/department-data`, { headers }),
-        axios.get(`${BACKEND_URL}/api/dashboard/salary-data`, { headers }),
-        axios.get(`${BACKEND_URL}/api/dashboard/recent-activities`, { headers })
-      ]);
-
-      setStats(statsRes.data);
-      setDepartmentData(deptRes.data);
-      setSalaryData(salaryRes.data);
-      setRecentActivities(activitiesRes.data);
+      const res = await axios.get(`${BACKEND_URL}/api/dashboard/snapshot`, { headers });
+      applySnapshot(res.data);
+      setError('');
     } catch (err) {
       // Provide more detailed error information to help debugging
       const responseDetail = err?.response?.data?.detail || err?.response?.data;
@@ -51,7 +47,55 @@ function DashboardPage({ user, onLogout }) {
     } finally {
       setLoading(false);
     }
-  };
+  }, [applySnapshot]);
+
+  useEffect(() => {
+    fetchDashboardData();
+
+    // Live updates: the server pushes changed panels instead of us polling
+    const token = localStorage.getItem('token');
+    if (!token || typeof EventSource === 'undefined') return undefined;
+
+    let source = null;
+    let retryTimer = null;
+    let closed = false;
+    const onMessage = (event) => {
+      try {
+        applySnapshot(JSON.parse(event.data));
+      } catch (err) {
+        console.error('Dashboard stream parse error:', err);
+      }
+    };
+
+    // EventSource cannot send headers, so the URL carries a short-lived stream
+    // ticket (never the login token). Tickets expire, so every reconnect
+    // fetches a new one instead of letting EventSource retry the old URL.
+    const connect = async () => {
+      try {
+        const res = await axios.post(`${BACKEND_URL}/api/dashboard/stream-ticket`, null, {
+          headers: { Authorization: `Bearer ${token}` }
+        });
+        if (closed) return;
+        source = new EventSource(`${BACKEND_URL}/api/dashboard/stream?ticket=${encodeURIComponent(res.data.ticket)}`);
+        source.addEventListener('snapshot', onMessage);
+        source.addEventListener('delta', onMessage);
+        source.onerror = () => {
+          source.close();
+          if (!closed) retryTimer = setTimeout(connect, 5000);
+        };
+      } catch (err) {
+        console.error('Dashboard stream ticket error:', err);
+        if (!closed) retryTimer = setTimeout(connect, 5000);
+      }
+    };
+    connect();
+
+    return () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      if (source) source.close();
+    };
+  }, [fetchDashboardData, applySnapshot]);
 
   const handleLogout = () => {
     onLogout();